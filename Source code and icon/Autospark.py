@@ -23,14 +23,9 @@ def main():
     root.geometry("900x600")
     root.minsize(800, 500)
 
-    # Apply theme
+    # Apply theme (the app's own styles are configured by AutomationApp)
     style = ttk.Style()
     style.theme_use('clam')
-    style.configure("Treeview", background="white", foreground="black", rowheight=25, fieldbackground="white")
-    style.configure("Treeview.Heading", background="#e0e0e0", foreground="black", relief="raised", font=('Arial', 9, 'bold'))
-    style.map('Treeview', background=[('selected', '#e0e0ff')], foreground=[('selected', 'black')])
-    style.layout("Treeview", [('Treeview.treearea', {'sticky': 'nswe'})])
-    style.configure("TButton", font=("Segoe UI", 10), padding=6)
 
     app = AutomationApp(root)
     root.mainloop()
@@ -43,19 +38,32 @@ if __name__ == "__main__":
         logger = logging.getLogger()
         logger.info("Starting AutoSpark app...")
 
+        import atexit
+
         class Logger:
             def __init__(self, filename="debug_output.txt"):
                 self.terminal = sys.__stdout__
-                self.log = open(filename, "w")
+                # Resolve the terminal writer once; there is no terminal in a windowed build
+                self._terminal_write = self.terminal.write if self.terminal else None
+                # The log file is only created on the first write, so quiet runs leave no file
+                self._filename = filename
+                self.log = None
+                self._log_write = self._open_log_and_write
+                atexit.register(self.flush)
+
+            def _open_log_and_write(self, message):
+                # Buffer log output and flush it once at exit instead of on every write
+                self.log = open(self._filename, "w", buffering=65536)
+                self._log_write = self.log.write
+                self._log_write(message)
 
             def write(self, message):
-                if self.terminal:
+                if self._terminal_write is not None:
                     try:
-                        self.terminal.write(message)
+                        self._terminal_write(message)
                     except Exception:
                         pass
-                self.log.write(message)
-                self.log.flush()
+                self._log_write(message)
 
             def flush(self):
                 if self.terminal:
@@ -63,7 +71,8 @@ if __name__ == "__main__":
                         self.terminal.flush()
                     except Exception:
                         pass
-                self.log.flush()
+                if self.log is not None:
+                    self.log.flush()
 
         sys.stdout = Logger()
         sys.stderr = Logger("error_output.txt")
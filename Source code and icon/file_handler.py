@@ -3,8 +3,214 @@ File Handler for the AutoSpark Application
 Handles saving and loading tasks to/from files
 """
 import os
+import re
 import json
 import time
+from dataclasses import asdict
+from operator import attrgetter
+
+from task_manager import Task
+
+# orjson is optional; it only speeds up the .json task list format
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Buffer size for task and BAT files, so many small writes reach the disk at once
+FILE_BUFFER_SIZE = 1024 * 1024
+
+# Unpacks the (type, details, additional) fields of a task
+_task_fields = attrgetter("type", "details", "additional")
+
+# One task line: [task_type] | details | additional (optional)
+_TASK_LINE_RE = re.compile(r'^[ \t]*\[([^\]\n]*)\][ \t]*\|([^|\n]*)(?:\|([^\n]*))?', re.M)
+
+# Safe PowerShell script for the screenshot task — avoids string expansion issues.
+# Saves to the {safe_path} folder; inner quotes are escaped as \" because the
+# script is passed inside -Command "..."
+_PS_SCREENSHOT_SCRIPT = (
+    '$ts=Get-Date -Format \\"yyyy-MM-dd_HH-mm-ss\\"; '
+    '$path=\\"{safe_path}\\screenshot_$ts.png\\"; '
+    '[void][Reflection.Assembly]::LoadWithPartialName(\\"System.Windows.Forms\\"); '
+    '[void][Reflection.Assembly]::LoadWithPartialName(\\"System.Drawing\\"); '
+    '$bounds = [System.Windows.Forms.Screen]::PrimaryScreen.Bounds; '
+    '$bmp = New-Object System.Drawing.Bitmap $bounds.Width, $bounds.Height; '
+    '$g = [System.Drawing.Graphics]::FromImage($bmp); '
+    '$g.CopyFromScreen($bounds.X, $bounds.Y, 0, 0, $bounds.Size); '
+    '$bmp.Save($path); '
+    '$g.Dispose(); $bmp.Dispose(); '
+    'Write-Host \\"Screenshot saved to: $path\\"'
+)
+
+# Batch file header; {base_name} is the name of the .txt file it was generated from
+_BAT_HEADER = ("@echo off\n"
+               "echo AutoSpark Application - Task Execution\n"
+               "echo Generated from: {base_name}\n"
+               "echo Run time: %DATE% %TIME%\n"
+               "echo.\n\n")
+
+# Batch file footer, with a pause at the end to keep the window open
+_BAT_FOOTER = ('echo All tasks completed.\n'
+               'pause\n')
+
+# Use DEL command with full path in quotes, both /F (force) and /Q (quiet) flags
+_DELETE_FILE_TEMPLATE = """\
+echo Deleting file: {safe_path}
+if exist "{safe_path}" (
+  del /F /Q "{safe_path}"
+  echo Return code: %ERRORLEVEL%
+  if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Failed to delete file with code %ERRORLEVEL%
+  ) else (
+    echo Successfully deleted file: {safe_path}
+  )
+) else (
+  echo WARNING: File not found: {safe_path}
+)
+"""
+
+# Delete every subfolder and file inside the folder, keeping the folder itself
+_EMPTY_FOLDER_TEMPLATE = """\
+echo Emptying folder: {safe_path}
+if exist "{safe_path}" (
+  echo Deleting all subfolders in: {safe_path}
+  for /d %%i in ("{safe_path}\\*") do (
+    rmdir /s /q "%%i" >nul 2>&1
+  )
+  echo Deleting all files in: {safe_path}
+  del /f /q "{safe_path}\\*" >nul 2>&1
+  echo Return code: %ERRORLEVEL%
+  if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Failed to empty folder with code %ERRORLEVEL%
+  ) else (
+    echo Successfully emptied folder: {safe_path}
+  )
+) else (
+  echo WARNING: Folder not found: {safe_path}
+)
+"""
+
+# Delete recursively
+_DELETE_FOLDER_TEMPLATE = """\
+echo Deleting folder: {safe_path}
+if exist "{safe_path}" (
+  rmdir /s /q "{safe_path}"
+  echo Return code: %ERRORLEVEL%
+  if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Failed to delete folder with code %ERRORLEVEL%
+  ) else (
+    echo Successfully deleted folder and its contents: {safe_path}
+  )
+) else (
+  echo WARNING: Folder not found: {safe_path}
+)
+"""
+
+# rmdir without /s only succeeds if the folder is empty
+_DELETE_FOLDER_IF_EMPTY_TEMPLATE = """\
+echo Attempting to delete folder (only if empty): {safe_path}
+if exist "{safe_path}" (
+  rmdir /q "{safe_path}"
+  if exist "{safe_path}" (
+    echo WARNING: Could not delete folder {safe_path} — it may not be empty or is locked
+  ) else (
+    echo Successfully deleted empty folder: {safe_path}
+  )
+) else (
+  echo WARNING: Folder not found: {safe_path}
+)
+"""
+
+# Check the source exists, create the destination folder (and a subfolder named
+# after the source) if needed, then copy with xcopy, overwriting existing files
+_BACKUP_FOLDER_TEMPLATE = """\
+echo Backing up folder: {safe_path}
+echo to: {safe_dest}
+if not exist "{safe_path}" (
+  echo ERROR: Source folder not found: {safe_path}
+  goto :backup_error
+)
+if not exist "{safe_dest}" (
+  mkdir "{safe_dest}"
+  if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Could not create destination folder: {safe_dest}
+    goto :backup_error
+  )
+)
+for %%I in ("{safe_path}") do set "source_name=%%~nxI"
+set "dest_path={safe_dest}\\%source_name%"
+if not exist "%dest_path%" (
+  mkdir "%dest_path%"
+  if %ERRORLEVEL% NEQ 0 (
+    echo ERROR: Could not create destination folder: %dest_path%
+    goto :backup_error
+  )
+)
+xcopy "{safe_path}\\*" "%dest_path%" /E /H /C /I /Y
+if %ERRORLEVEL% NEQ 0 (
+  echo ERROR: Backup operation failed
+  goto :backup_error
+) else (
+  echo Successfully backed up {safe_path} to %dest_path%
+)
+goto :backup_end
+:backup_error
+echo Backup operation failed
+:backup_end
+"""
+
+# Batch code emitted for each task type, filled in with str.format_map().
+# Available fields: details, safe_path, safe_dest, seconds, scan_type, ps_command
+_BAT_TEMPLATES = {
+    "open_app": 'start "" "{details}"\n',
+    "open_file": 'start "" "{details}"\n',
+    "close_app": ('taskkill /f /im "{details}" >nul 2>&1\n'
+                  'if %ERRORLEVEL% EQU 0 (echo Successfully closed {details}) else (echo Failed to close {details})\n'),
+    "run_command": '{details}\n',
+    "delay": ('echo Waiting for {seconds} seconds...\n'
+              'timeout /t {seconds} /nobreak >nul\n'),
+    "shutdown": ('echo System will shutdown in {details} seconds...\n'
+                 'shutdown /s /t {details}\n'),
+    "restart": ('echo System will restart in {details} seconds...\n'
+                'shutdown /r /t {details}\n'),
+    "sleep": ('echo Putting system to sleep...\n'
+              'rundll32.exe powrprof.dll,SetSuspendState 0,1,0\n'),
+    "screenshot": ('echo Taking screenshot...\n'
+                   'if not exist "{safe_path}" mkdir "{safe_path}"\n'
+                   'powershell -NoProfile -ExecutionPolicy Bypass -Command "' + _PS_SCREENSHOT_SCRIPT + '"\n'
+                   'if %ERRORLEVEL% NEQ 0 echo ERROR: Failed to take screenshot\n\n'),
+    "clean_temp": ('echo Cleaning temporary files...\n'
+                   'del /q /f /s "%TEMP%\\*" >nul 2>&1\n'
+                   'echo Temporary files cleaned.\n'),
+    "security_scan": ('echo Running {scan_type} security scan...\n'
+                      'powershell -Command "{ps_command}"\n'),
+    "delete_file": _DELETE_FILE_TEMPLATE,
+    "empty_folder": _EMPTY_FOLDER_TEMPLATE,
+    "delete_folder": _DELETE_FOLDER_TEMPLATE,
+    "delete_folder_if_empty": _DELETE_FOLDER_IF_EMPTY_TEMPLATE,
+    "backup_folder": _BACKUP_FOLDER_TEMPLATE,
+}
+
+# URL prefixes that open_url tasks accept without adding https://
+_URL_SCHEMES = ('http://', 'https://', 'ftp://', 'file://')
+
+# Task types whose details (and, for backups, additional info) are file system paths
+_PATH_TASKS = frozenset({
+    "screenshot",
+    "delete_file",
+    "empty_folder",
+    "delete_folder",
+    "delete_folder_if_empty",
+    "backup_folder",
+})
+
+# Windows Defender commands for the security_scan task
+_SCAN_COMMANDS = {
+    "quick": "Start-MpScan -ScanType QuickScan",
+    "full": "Start-MpScan -ScanType FullScan",
+}
+_DEFAULT_SCAN_COMMAND = "Start-MpScan -ScanType CustomScan"
 
 class FileHandler:
     """Handles file operations for the task automation application"""
@@ -15,10 +221,11 @@ class FileHandler:
         
     def save_tasks(self, tasks, file_path):
         """
-        Save tasks to a text file
+        Save tasks to a text file, along with the matching .bat file.
+        Paths ending in .json are saved in JSON format instead of text.
         
         Args:
-            tasks (list): List of task dictionaries
+            tasks (list): List of Task objects
             file_path (str): Path to save the file
             
         Returns:
@@ -28,44 +235,77 @@ class FileHandler:
             Exception: If the file cannot be saved
         """
         try:
+            if file_path.lower().endswith('.json'):
+                with open(file_path, 'wb', buffering=FILE_BUFFER_SIZE) as f:
+                    # orjson serializes dataclasses natively; json needs them as dictionaries
+                    f.write(orjson.dumps(tasks) if orjson else json.dumps(tasks, default=asdict).encode('utf-8'))
+                    
+                # Convert to BAT file also
+                self.convert_to_bat(tasks, file_path)
+                return file_path
+            
             # If the file_path doesn't end with .txt, add it
             if not file_path.lower().endswith('.txt'):
                 file_path += '.txt'
             
-            with open(file_path, 'w') as f:
-                # Write header
-                f.write("# AutoSpark Application - Task List\n")
-                f.write("# Generated on: " + time.strftime("%Y-%m-%d %H:%M:%S") + "\n")
-                f.write("# Format: [Task Type] | [Details] | [Additional Info (optional)]\n\n")
-                
-                # Write task entries
-                for task in tasks:
-                    task_type = task.get("type", "")
-                    details = task.get("details", "")
-                    additional = task.get("additional", "")
-                    
-                    f.write(f"[{task_type}] | {details}")
-                    if additional:
-                        f.write(f" | {additional}")
-                    f.write("\n")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             
-            # Convert to BAT file also
-            self.convert_to_bat(tasks, file_path)
+            # Build the task list and its BAT script in the same pass over the tasks
+            lines = ["# AutoSpark Application - Task List\n"
+                     f"# Generated on: {timestamp}\n"
+                     "# Format: [Task Type] | [Details] | [Additional Info (optional)]\n\n"]
+            append = lines.append
+            bat_lines = [_BAT_HEADER.format(base_name=os.path.basename(file_path))]
+            
+            # Task entries, one line each
+            for i, task in enumerate(tasks, 1):
+                task_type, details, additional = _task_fields(task)
+                if additional:
+                    append(f"[{task_type}] | {details} | {additional}\n")
+                else:
+                    append(f"[{task_type}] | {details}\n")
+                self._write_bat_task(bat_lines, i, task_type, details, additional)
+            
+            bat_lines.append(_BAT_FOOTER)
+            
+            with open(file_path, 'w', buffering=FILE_BUFFER_SIZE) as f:
+                f.writelines(lines)
+            
+            # Write the BAT file also
+            with open(self.get_bat_path(file_path), 'w', buffering=FILE_BUFFER_SIZE) as f:
+                f.write("".join(bat_lines))
             
             return file_path
             
         except Exception as e:
             raise Exception(f"Error saving tasks to file: {str(e)}")
             
+    def save_all(self, tasks, file_path):
+        """
+        Save tasks to a file together with their BAT file
+        
+        Args:
+            tasks (list): List of Task objects
+            file_path (str): Path to save the file to
+            
+        Returns:
+            str: Path to the created BAT file
+            
+        Raises:
+            Exception: If the files cannot be saved
+        """
+        # save_tasks writes the BAT file as well, so only its path is needed here
+        return self.get_bat_path(self.save_tasks(tasks, file_path))
+            
     def load_tasks(self, file_path):
         """
-        Load tasks from a text file
+        Load tasks from a text file, or from a JSON file if the path ends in .json
         
         Args:
             file_path (str): Path to the file to load
             
         Returns:
-            list: List of task dictionaries
+            list: List of Task objects
             
         Raises:
             Exception: If the file cannot be loaded
@@ -74,10 +314,18 @@ class FileHandler:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
                 
-            with open(file_path, 'r') as f:
-                content = f.read()
+            if file_path.lower().endswith('.json'):
+                with open(file_path, 'rb', buffering=FILE_BUFFER_SIZE) as f:
+                    data = f.read()
+                    
+                # Make sure every task has all three fields
+                return [Task(task.get("type", ""), task.get("details", ""), task.get("additional", ""))
+                        for task in (orjson.loads(data) if orjson else json.loads(data))]
+                
+            # Parse straight from the file, one line at a time
+            with open(file_path, 'r', buffering=FILE_BUFFER_SIZE) as f:
+                tasks = self.parse_stream(f)
                 
-            tasks = self.parse_text_to_tasks(content)
             return tasks
             
         except Exception as e:
@@ -85,48 +333,37 @@ class FileHandler:
             
     def parse_text_to_tasks(self, content):
         """
-        Parse text content into task dictionaries
+        Parse text content into tasks
         
         Args:
             content (str): Text content to parse
             
         Returns:
-            list: List of task dictionaries
+            list: List of Task objects
+        """
+        # Scan the whole text in one pass of the regex engine
+        return [Task(m[1].strip(), m[2].strip(), (m[3] or "").strip())
+                for m in _TASK_LINE_RE.finditer(content)]
+        
+    def parse_stream(self, lines):
+        """
+        Parse tasks from an iterable of lines, such as an open file
+        
+        Args:
+            lines (iterable): Lines of text to parse
+            
+        Returns:
+            list: List of Task objects
         """
         tasks = []
-        lines = content.strip().split('\n')
+        append = tasks.append
+        match = _TASK_LINE_RE.match
         
-        # Skip comments and empty lines
+        # Comments, empty lines and anything else not in task format don't match
         for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            # Parse task format: [task_type] | details | additional
-            if line.startswith('[') and ']' in line and '|' in line:
-                # Extract task type from [...]
-                task_type_end = line.find(']')
-                task_type = line[1:task_type_end].strip()
-                
-                # Split the rest by pipe symbol
-                rest = line[task_type_end + 1:].strip()
-                parts = [p.strip() for p in rest.split('|', 1)]
-                
-                details = parts[0] if parts else ""
-                
-                # Check if there's additional information
-                additional = ""
-                if len(parts) > 1 and '|' in parts[1]:
-                    additional_parts = parts[1].split('|', 1)
-                    additional = additional_parts[0].strip()
-                elif len(parts) > 1:
-                    additional = parts[1].strip()
-                
-                tasks.append({
-                    "type": task_type,
-                    "details": details,
-                    "additional": additional
-                })
+            m = match(line)
+            if m:
+                append(Task(m[1].strip(), m[2].strip(), (m[3] or "").strip()))
                 
         return tasks
         
@@ -135,7 +372,7 @@ class FileHandler:
         Convert tasks to a .bat file
         
         Args:
-            tasks (list): List of task dictionaries
+            tasks (list): List of Task objects
             txt_file_path (str): Path to the original .txt file
             
         Returns:
@@ -148,213 +385,73 @@ class FileHandler:
             # Get the corresponding .bat file path
             bat_file_path = self.get_bat_path(txt_file_path)
             
-            with open(bat_file_path, 'w') as f:
-                # Write batch file header
-                f.write("@echo off\n")
-                f.write("echo AutoSpark Application - Task Execution\n")
-                f.write("echo Generated from: " + os.path.basename(txt_file_path) + "\n")
-                f.write("echo Run time: %DATE% %TIME%\n")
-                f.write("echo.\n\n")
-                
-                for i, task in enumerate(tasks, 1):
-                    task_type = task.get("type", "")
-                    details = task.get("details", "")
-                    additional = task.get("additional", "")
-                    
-                    f.write(f"REM Task {i}: {task_type}\n")
-                    f.write(f"echo Executing Task {i}: {task_type}\n")
-                    
-                    if task_type == "open_url":
-                        self._write_url_code(f, details)
-                    elif task_type == "open_app":
-                        f.write(f'start "" "{details}"\n')
-                    elif task_type == "open_file":
-                        f.write(f'start "" "{details}"\n')
-                    elif task_type == "close_app":
-                        f.write(f'taskkill /f /im "{details}" >nul 2>&1\n')
-                        f.write('if %ERRORLEVEL% EQU 0 (echo Successfully closed {details}) else (echo Failed to close {details})\n')
-                    elif task_type == "run_command":
-                        f.write(f'{details}\n')
-                    elif task_type == "delay":
-                        seconds = int(details)
-                        f.write(f'echo Waiting for {seconds} seconds...\n')
-                        f.write(f'timeout /t {seconds} /nobreak >nul\n')
-                    elif task_type == "shutdown":
-                        f.write(f'echo System will shutdown in {details} seconds...\n')
-                        f.write(f'shutdown /s /t {details}\n')
-                    elif task_type == "restart":
-                        f.write(f'echo System will restart in {details} seconds...\n')
-                        f.write(f'shutdown /r /t {details}\n')
-                    elif task_type == "sleep":
-                        f.write('echo Putting system to sleep...\n')
-                        f.write('rundll32.exe powrprof.dll,SetSuspendState 0,1,0\n')
-                    elif task_type == "screenshot":
-                        f.write('echo Taking screenshot...\n')
-
-                        # Ensure the folder exists
-                        safe_path = details.replace('/', '\\')
-                        f.write(f'if not exist "{safe_path}" mkdir "{safe_path}"\n')
-
-                        # Safe PowerShell script — avoids string expansion issues
-                        f.write(f'powershell -NoProfile -ExecutionPolicy Bypass -Command "$ts=Get-Date -Format \\"yyyy-MM-dd_HH-mm-ss\\"; ')
-                        f.write(f'$path=\\"{safe_path}\\screenshot_$ts.png\\"; ')
-                        f.write('[void][Reflection.Assembly]::LoadWithPartialName(\\"System.Windows.Forms\\"); ')
-                        f.write('[void][Reflection.Assembly]::LoadWithPartialName(\\"System.Drawing\\"); ')
-                        f.write('$bounds = [System.Windows.Forms.Screen]::PrimaryScreen.Bounds; ')
-                        f.write('$bmp = New-Object System.Drawing.Bitmap $bounds.Width, $bounds.Height; ')
-                        f.write('$g = [System.Drawing.Graphics]::FromImage($bmp); ')
-                        f.write('$g.CopyFromScreen($bounds.X, $bounds.Y, 0, 0, $bounds.Size); ')
-                        f.write('$bmp.Save($path); ')
-                        f.write('$g.Dispose(); $bmp.Dispose(); ')
-                        f.write('Write-Host \\"Screenshot saved to: $path\\""\n')
-
-                        f.write('if %ERRORLEVEL% NEQ 0 echo ERROR: Failed to take screenshot\n\n')
-
-                    elif task_type == "clean_temp":
-                        f.write('echo Cleaning temporary files...\n')
-                        f.write('del /q /f /s "%TEMP%\\*" >nul 2>&1\n')
-                        f.write('echo Temporary files cleaned.\n')
-                    elif task_type == "security_scan":
-                        scan_type = details.lower()
-                        ps_command = ""
-                        if scan_type == "quick":
-                            ps_command = "Start-MpScan -ScanType QuickScan"
-                        elif scan_type == "full":
-                            ps_command = "Start-MpScan -ScanType FullScan"
-                        else:
-                            ps_command = "Start-MpScan -ScanType CustomScan"
-                            
-                        f.write(f'echo Running {scan_type} security scan...\n')
-                        f.write(f'powershell -Command "{ps_command}"\n')
-                    elif task_type == "delete_file":
-                        # Make sure the path uses proper Windows path format with double backslashes
-                        safe_path = details.replace('/', '\\')
-                        
-                        f.write(f'echo Deleting file: {safe_path}\n')
-                        f.write(f'if exist "{safe_path}" (\n')
-                        # Use DEL command with full path in quotes, both /F (force) and /Q (quiet) flags
-                        f.write(f'  del /F /Q "{safe_path}"\n')
-                        f.write(f'  echo Return code: %ERRORLEVEL%\n') 
-                        f.write(f'  if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'    echo ERROR: Failed to delete file with code %ERRORLEVEL%\n')
-                        f.write(f'  ) else (\n')
-                        f.write(f'    echo Successfully deleted file: {safe_path}\n')
-                        f.write(f'  )\n')
-                        f.write(f') else (\n')
-                        f.write(f'  echo WARNING: File not found: {safe_path}\n')
-                        f.write(f')\n')
-                    elif task_type == "empty_folder":
-                            # Ensure the path uses proper Windows path format with double backslashes
-                        safe_path = details.replace('/', '\\')
-                        f.write(f'echo Emptying folder: {safe_path}\n')
-                        f.write(f'if exist "{safe_path}" (\n')
-                        f.write(f'  echo Deleting all subfolders in: {safe_path}\n')
-                        f.write(f'  for /d %%i in ("{safe_path}\\*") do (\n')
-                        f.write(f'    rmdir /s /q "%%i" >nul 2>&1\n')
-                        f.write(f'  )\n')
-                        f.write(f'  echo Deleting all files in: {safe_path}\n')
-                        f.write(f'  del /f /q "{safe_path}\\*" >nul 2>&1\n')
-                        f.write(f'  echo Return code: %ERRORLEVEL%\n')
-                        f.write(f'  if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'    echo ERROR: Failed to empty folder with code %ERRORLEVEL%\n')
-                        f.write(f'  ) else (\n')
-                        f.write(f'    echo Successfully emptied folder: {safe_path}\n')
-                        f.write(f'  )\n')
-                        f.write(f') else (\n')
-                        f.write(f'  echo WARNING: Folder not found: {safe_path}\n')
-                        f.write(f')\n')
-                    elif task_type == "delete_folder":
-                        # Make sure the path uses proper Windows path format with double backslashes
-                        safe_path = details.replace('/', '\\')
-                        
-                        f.write(f'echo Deleting folder: {safe_path}\n')
-                        # Delete recursively
-                        f.write(f'if exist "{safe_path}" (\n')
-                        f.write(f'  rmdir /s /q "{safe_path}"\n')
-                        f.write(f'  echo Return code: %ERRORLEVEL%\n')
-                        f.write(f'  if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'    echo ERROR: Failed to delete folder with code %ERRORLEVEL%\n')
-                        f.write(f'  ) else (\n')
-                        f.write(f'    echo Successfully deleted folder and its contents: {safe_path}\n')
-                        f.write(f'  )\n')
-                        f.write(f') else (\n')
-                        f.write(f'  echo WARNING: Folder not found: {safe_path}\n')
-                        f.write(f')\n')
-                    elif task_type == "delete_folder_if_empty":
-                        safe_path = details.replace('/', '\\')
-                        f.write(f'echo Attempting to delete folder (only if empty): {safe_path}\n')
-                        f.write(f'if exist "{safe_path}" (\n')
-                        f.write(f'  rmdir /q "{safe_path}"\n')
-                        f.write(f'  if exist "{safe_path}" (\n')
-                        f.write(f'    echo WARNING: Could not delete folder {safe_path} — it may not be empty or is locked\n')
-                        f.write(f'  ) else (\n')
-                        f.write(f'    echo Successfully deleted empty folder: {safe_path}\n')
-                        f.write(f'  )\n')
-                        f.write(f') else (\n')
-                        f.write(f'  echo WARNING: Folder not found: {safe_path}\n')
-                        f.write(f')\n')
-                    elif task_type == "backup_folder":
-                        # Make sure the paths use proper Windows path format with double backslashes
-                        safe_source = details.replace('/', '\\')
-                        safe_dest = additional.replace('/', '\\')
-                        
-                        f.write(f'echo Backing up folder: {safe_source}\n')
-                        f.write(f'echo to: {safe_dest}\n')
-                        
-                        # Check if source exists
-                        f.write(f'if not exist "{safe_source}" (\n')
-                        f.write(f'  echo ERROR: Source folder not found: {safe_source}\n')
-                        f.write(f'  goto :backup_error\n')
-                        f.write(f')\n')
-                        
-                        # Create destination folder if it doesn't exist
-                        f.write(f'if not exist "{safe_dest}" (\n')
-                        f.write(f'  mkdir "{safe_dest}"\n')
-                        f.write(f'  if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'    echo ERROR: Could not create destination folder: {safe_dest}\n')
-                        f.write(f'    goto :backup_error\n')
-                        f.write(f'  )\n')
-                        f.write(f')\n')
-                        
-                        # Get the folder name from the path
-                        f.write(f'for %%I in ("{safe_source}") do set "source_name=%%~nxI"\n')
-                        
-                        # Create destination folder if it doesn't exist
-                        f.write(f'set "dest_path={safe_dest}\\%source_name%"\n')
-                        f.write(f'if not exist "%dest_path%" (\n')
-                        f.write(f'  mkdir "%dest_path%"\n')
-                        f.write(f'  if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'    echo ERROR: Could not create destination folder: %dest_path%\n')
-                        f.write(f'    goto :backup_error\n')
-                        f.write(f'  )\n')
-                        f.write(f')\n')
-                        
-                        # Copy the folder contents with xcopy (overwriting existing files)
-                        f.write(f'xcopy "{safe_source}\\*" "%dest_path%" /E /H /C /I /Y\n')
-                        f.write(f'if %ERRORLEVEL% NEQ 0 (\n')
-                        f.write(f'  echo ERROR: Backup operation failed\n')
-                        f.write(f'  goto :backup_error\n')
-                        f.write(f') else (\n')
-                        f.write(f'  echo Successfully backed up {safe_source} to %dest_path%\n')
-                        f.write(f')\n')
-                        f.write(f'goto :backup_end\n')
-                        f.write(f':backup_error\n')
-                        f.write(f'echo Backup operation failed\n')
-                        f.write(f':backup_end\n')
-                    else:
-                        f.write(f'echo Unknown task type: {task_type}\n')
-                    
-                    f.write('echo.\n\n')
-                
-                # Add a pause at the end to keep the window open
-                f.write('echo All tasks completed.\n')
-                f.write('pause\n')
+            # Build the whole batch script in memory and write it in one call
+            out = [_BAT_HEADER.format(base_name=os.path.basename(txt_file_path))]
+            for i, task in enumerate(tasks, 1):
+                self._write_bat_task(out, i, *_task_fields(task))
+            
+            out.append(_BAT_FOOTER)
+            
+            with open(bat_file_path, 'w', buffering=FILE_BUFFER_SIZE) as f:
+                f.write("".join(out))
             
             return bat_file_path
             
         except Exception as e:
             raise Exception(f"Error creating BAT file: {str(e)}")
     
+    def _write_bat_task(self, out, number, task_type, details, additional):
+        """
+        Append the batch code for a single task
+        
+        Args:
+            out (list): List of batch script chunks to append to
+            number (int): 1-based position of the task in the list
+            task_type (str): The type of task
+            details (str): The main details of the task
+            additional (str): Additional information for the task
+        """
+        out.append(f"REM Task {number}: {task_type}\n"
+                   f"echo Executing Task {number}: {task_type}\n")
+        
+        template = _BAT_TEMPLATES.get(task_type)
+        if task_type == "open_url":
+            self._write_url_code(out, details)
+        elif template is not None:
+            out.append(template.format_map(self._template_context(task_type, details, additional)))
+        else:
+            out.append(f'echo Unknown task type: {task_type}\n')
+        
+        out.append('echo.\n\n')
+    
+    def _template_context(self, task_type, details, additional):
+        """
+        Build the fields used to fill in a task's batch template
+        
+        Args:
+            task_type (str): The type of task
+            details (str): The main details of the task
+            additional (str): Additional information for the task
+            
+        Returns:
+            dict: Template fields for the task
+        """
+        context = {"details": details}
+        
+        # Convert paths to Windows format once per task, and only for tasks that use them
+        if task_type in _PATH_TASKS:
+            context["safe_path"] = details.replace('/', '\\')
+            if task_type == "backup_folder":
+                context["safe_dest"] = additional.replace('/', '\\')
+        elif task_type == "delay":
+            context["seconds"] = int(details)
+        elif task_type == "security_scan":
+            scan_type = details.lower()
+            context["scan_type"] = scan_type
+            context["ps_command"] = _SCAN_COMMANDS.get(scan_type, _DEFAULT_SCAN_COMMAND)
+            
+        return context
+    
     def get_bat_path(self, txt_file_path):
         """
         Get the corresponding .bat file path for a .txt file path
@@ -369,33 +466,30 @@ class FileHandler:
         base, ext = os.path.splitext(txt_file_path)
         return base + '.bat'
     
-    def _write_url_code(self, file, url):
+    def _write_url_code(self, out, url):
         """
-        Write batch code to open a URL using the default web browser.
+        Append batch code to open a URL using the default web browser.
         Uses the 'start' command, which is fast and compatible with most Windows versions.
 
         Args:
-            file: An open file object to write to
+            out (list): List of batch script chunks to append to
             url (str): The URL to open
         """
-        file.write('echo Opening URL in default web browser...\n')
+        out.append('echo Opening URL in default web browser...\n')
 
         # Ensure the URL has a proper protocol
-        if not (url.startswith('http://') or url.startswith('https://') or 
-                url.startswith('ftp://') or url.startswith('file://')):
-            file.write('echo No protocol specified, using https:// by default\n')
+        if not url.startswith(_URL_SCHEMES):
+            out.append('echo No protocol specified, using https:// by default\n')
             url = 'https://' + url
 
         # Use the 'start' command to open the URL
-        file.write('echo Using start command...\n')
-        file.write(f'start "" "{url}"\n')
-        file.write('if %ERRORLEVEL% NEQ 0 (\n')
-        file.write('    echo ERROR: Failed to open URL.\n')
-        file.write(f'    echo URL: {url}\n')
-        file.write(') else (\n')
-        file.write(f'    echo Successfully opened URL: {url}\n')
-        file.write(')\n\n')
-
-        
-        # End label
-        file.write(':url_end\n')
\ No newline at end of file
+        out.append('echo Using start command...\n'
+                   f'start "" "{url}"\n'
+                   'if %ERRORLEVEL% NEQ 0 (\n'
+                   '    echo ERROR: Failed to open URL.\n'
+                   f'    echo URL: {url}\n'
+                   ') else (\n'
+                   f'    echo Successfully opened URL: {url}\n'
+                   ')\n\n'
+                   # End label
+                   ':url_end\n')
@@ -2,21 +2,111 @@
 GUI Components for the AutoSpark Application
 """
 
-import os
-import time
+from os.path import basename
+from functools import partial
+from itertools import islice
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog, scrolledtext
-import webbrowser
-from datetime import datetime
-from PIL import Image, ImageTk
+from tkinter import ttk, filedialog, messagebox, simpledialog
 
 from task_manager import TaskManager
 from task_executor import TaskExecutor
 from file_handler import FileHandler
 
+# Row tags for alternating task list colors, shared by every row
+EVEN_ROW_TAGS = ("evenrow",)
+ODD_ROW_TAGS = ("oddrow",)
+
+def _normalize_url(url):
+    """Add https:// to a URL entered without a scheme"""
+    if not url.startswith(("http://", "https://")):
+        url = "https://" + url
+    return url
+
+# Dialogs used to ask for the details of a new task, by kind
+_TASK_DIALOGS = {
+    "string": simpledialog.askstring,
+    "integer": simpledialog.askinteger,
+    "file": filedialog.askopenfilename,
+    "folder": filedialog.askdirectory,
+}
+
 class AutomationApp:
     """Main application class for the AutoSpark application"""
     
+    # Task buttons on the right-hand panel: (group label, ((button label, task type), ...))
+    TASK_BUTTONS = (
+        ("System Tasks", (
+            ("Open URL", "open_url"),
+            ("Open Application", "open_app"),
+            ("Open File", "open_file"),
+            ("Delete File", "delete_file"),
+            ("Delete Folder & Contents", "delete_folder"),
+            ("Empty Folder", "empty_folder"),
+            ("Delete If Empty", "delete_folder_if_empty"),
+            ("Close Application", "close_app"),
+            ("Run Command", "run_command"),
+        )),
+        ("System Control", (
+            ("Shutdown PC", "shutdown"),
+            ("Restart PC", "restart"),
+            ("Sleep PC", "sleep"),
+        )),
+        ("Utilities", (
+            ("Add Delay", "delay"),
+            ("Take Screenshot", "screenshot"),
+            ("Clean Temp Folder", "clean_temp"),
+            ("Run Security Scan", "security_scan"),
+            ("Backup Folder", "backup_folder"),
+        )),
+    )
+    
+    # How each task type is added, used by _add_task:
+    # task type -> (dialog kind or None, dialog args, dialog options,
+    #               details conversion, additional info, status message)
+    # The status message can use {details}, {name} (base name of details) and {additional}
+    TASK_SPECS = {
+        "open_url": ("string", ("Open URL", "Enter the URL to open:"), {},
+                     _normalize_url, "", "Open URL {details}"),
+        "open_app": ("file", (), {"title": "Select Application",
+                                  "filetypes": [("Executable Files", "*.exe"), ("All Files", "*.*")]},
+                     str, "", "Open Application {name}"),
+        "open_file": ("file", (), {"title": "Select File to Open"},
+                      str, "", "Open File {name}"),
+        "delete_file": ("file", (), {"title": "Select File to Delete",
+                                     "filetypes": [("All Files", "*.*")]},
+                        str, "", "Delete file {name}"),
+        "delete_folder": ("folder", (), {"title": "Select Folder to Delete with Contents"},
+                          str, "with contents", "Delete folder {name} and all its contents"),
+        "empty_folder": ("folder", (), {"title": "Select Folder to Empty"},
+                         str, "", "Empty folder {name} (keep folder)"),
+        "delete_folder_if_empty": ("folder", (), {"title": "Select Folder to Delete (if empty)"},
+                                   str, "", "Delete folder {name} only if empty"),
+        "close_app": ("string", ("Close Application",
+                                 "Enter the application name to close (e.g., notepad.exe):"), {},
+                      str, "", "Close Application {details}"),
+        "run_command": ("string", ("Run Command", "Enter the command to run in command prompt:"), {},
+                        str, "", "Run Command {details}"),
+        "shutdown": ("integer", ("Shutdown Delay",
+                                 "Enter delay in seconds before shutdown (0 for immediate):"),
+                     {"initialvalue": 0, "minvalue": 0},
+                     str, "", "Shutdown PC with {details}s delay"),
+        "restart": ("integer", ("Restart Delay",
+                                "Enter delay in seconds before restart (0 for immediate):"),
+                    {"initialvalue": 0, "minvalue": 0},
+                    str, "", "Restart PC with {details}s delay"),
+        "sleep": (None, (), {}, str, "", "Sleep PC"),
+        "delay": ("integer", ("Add Delay", "Enter delay in seconds:"),
+                  {"initialvalue": 5, "minvalue": 1},
+                  str, "", "Delay for {details} seconds"),
+        "screenshot": ("folder", (), {"title": "Select folder to save screenshots"},
+                       str, "", "Take screenshot to {details}"),
+        "clean_temp": (None, (), {}, str, "", "Clean temporary files"),
+        "security_scan": ("string", ("Security Scan", "Enter scan type (quick or full):"),
+                          {"initialvalue": "quick"},
+                          str.lower, "", "Run {details} security scan"),
+        "backup_folder": ("backup", (), {}, str, "", "Backup {details} to {additional}"),
+    }
+    
     def __init__(self, master):
         """Initialize the application"""
         self.master = master
@@ -28,9 +118,17 @@ class AutomationApp:
         self.currently_editing = False
         self.current_file_path = None
         
-        # Initialize timestamps for tracking unsaved changes
-        self.last_save_time = 0
-        self.last_modification_time = 0
+        # Whether the tasks have changed since they were last saved or loaded
+        self._dirty = False
+        
+        # BAT file written by the last save of the current list, or None
+        self._saved_bat_path = None
+        
+        # Task list rows waiting to be redrawn as a (start, stop) range, or None
+        self._pending_rows = None
+        
+        # Set up visual styling before any widgets are created
+        self._configure_styles()
         
         # Create the main UI components
         self._create_menu()
@@ -60,43 +158,45 @@ class AutomationApp:
         self.master.config(menu=menubar)
     
     def _configure_styles(self):
-        """Configure custom styles for the application"""
+        """Configure all custom styles for the application in a single pass"""
         style = ttk.Style()
         
-        # ---- GRID TREEVIEW STYLE ----
-        # Create a custom style with visible grid lines to match the screenshot exactly
-        style.configure("Grid.Treeview",
-                        background="#ffffff",
-                        fieldbackground="#ffffff",
+        # ---- TASK LIST (TREEVIEW) STYLE ----
+        # White rows with visible borders, keeping only the tree area in the layout
+        style.configure("Treeview",
+                        background="white",
                         foreground="black",
-                        font=('Arial', 9),
                         rowheight=25,
-                        borderwidth=1)
-        
-        # Make the grid lines visible by adding a border to cells
-        # This creates the exact grid layout as shown in the screenshot
-        style.layout("Grid.Treeview", [
-            ('Grid.Treeview.treearea', {'sticky': 'nswe', 'border': '1'})
-        ])
+                        fieldbackground="white",
+                        borderwidth=1,
+                        relief="solid")
+        style.map("Treeview",
+                  background=[('selected', '#e5f1fb')],
+                  foreground=[('selected', 'black')])
+        style.layout("Treeview", [('Treeview.treearea', {'sticky': 'nswe'})])
         
         # Configure the Treeview heading (column headers) to have a gray background
-        # with visible borders like in the screenshot
-        style.configure("Grid.Treeview.Heading",
-                        background="#f0f0f0",
+        # with visible borders
+        style.configure("Treeview.Heading",
+                        background="#e0e0e0",
                         foreground="black",
                         relief="raised",
-                        font=('Arial', 9, 'bold'),
-                        borderwidth=1)
+                        borderwidth=1,
+                        font=('Arial', 9, 'bold'))
         
         # ---- OTHER STYLES ----
+        style.configure("TButton", font=("Segoe UI", 10), padding=6)
+        
         # Configure a style for accent buttons like "Run Tasks"
         style.configure("Accent.TButton",
                         background="#0078d7",
                         foreground="white")
                         
-        # Configure style for the button panel frame
+        # Configure styles for the task button panel and its label
         style.configure("ButtonPanel.TFrame",
                       background="#dcdad5")
+        style.configure("TaskPanel.TFrame", background="#dcdad5")
+        style.configure("TaskLabel.TLabel", background="#dcdad5")
     
     def _create_main_interface(self):
         """Create the main user interface components"""
@@ -104,9 +204,6 @@ class AutomationApp:
         main_frame = ttk.Frame(self.master, padding="10")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Set up visual styling for the application
-        self._configure_styles()
-        
         # Task List Frame (Left side)
         task_frame = ttk.LabelFrame(main_frame, text="Task Sequence", padding="10")
         task_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -119,24 +216,13 @@ class AutomationApp:
         tree_container = tk.Frame(task_frame, bd=2, relief=tk.GROOVE, bg='#d9d9d9')
         tree_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # Create and configure a Treeview style with showseparators enabled
-        style = ttk.Style()
-        style.configure("CustomTreeview", 
-                        background="white",
-                        foreground="black", 
-                        rowheight=25,
-                        borderwidth=1, 
-                        relief="solid")
-        style.layout("CustomTreeview", 
-                    [('CustomTreeview.treearea', {'sticky': 'nswe', 'border':'1'})])
-        
         # Create the Treeview with visible borders and column separators
+        # (styled by _configure_styles)
         self.task_tree = ttk.Treeview(
             tree_container,
             columns=columns,
             show="headings",  # We've removed "tree" to hide the first column 
-            selectmode="browse",
-            style="CustomTreeview"  # Use our custom style with separators
+            selectmode="extended"
         )
         
         # Define column headings
@@ -154,7 +240,7 @@ class AutomationApp:
         self.task_tree.configure(height=15)
         
         # Add tags for styling individual rows with alternate colors
-        self.task_tree.tag_configure("evenrow", background="#f8f8f8")
+        self.task_tree.tag_configure("evenrow", background="#f0f0f0")
         self.task_tree.tag_configure("oddrow", background="white")
         
         # Add vertical scrollbar
@@ -181,19 +267,15 @@ class AutomationApp:
         self.task_context_menu.add_command(label="Move Up", command=lambda: self.move_task("up"))
         self.task_context_menu.add_command(label="Move Down", command=lambda: self.move_task("down"))
         
-        # Bind the right-click event
+        # Bind the right-click and Delete key events
         self.task_tree.bind("<Button-3>", self.show_task_context_menu)
+        self.task_tree.bind("<Delete>", lambda e: self.delete_task())
         
         # Task Buttons Frame with Canvas for Scrolling
-        outer_frame_style = ttk.Style()
-        outer_frame_style.configure("TaskPanel.TFrame", background="#dcdad5")
         outer_button_frame = ttk.Frame(main_frame, padding="5", style="TaskPanel.TFrame")
         outer_button_frame.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add label in the outer frame
-        # Configure a label style that matches the background
-        label_style = ttk.Style()
-        label_style.configure("TaskLabel.TLabel", background="#dcdad5")
+        # Add label in the outer frame, styled to match the background
         ttk.Label(outer_button_frame, text="Add Tasks:", style="TaskLabel.TLabel").pack(pady=(0, 5), anchor=tk.W)
         
         # Create a canvas inside the outer frame that matches the parent background
@@ -223,19 +305,12 @@ class AutomationApp:
             # Make sure the window fills the width of the canvas
             canvas.itemconfig(canvas_window, width=canvas.winfo_width())
             
-        # Add mouse wheel scrolling
+        # Add mouse wheel scrolling, bound once to a tag shared by the canvas and
+        # the widgets inside it (see below) so other widgets never see the handler
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
             
-        def _bind_mouse_wheel(event):
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            
-        def _unbind_mouse_wheel(event):
-            canvas.unbind_all("<MouseWheel>")
-            
-        # Bind the mousewheel only when mouse is over the canvas
-        canvas.bind("<Enter>", _bind_mouse_wheel)
-        canvas.bind("<Leave>", _unbind_mouse_wheel)
+        canvas.bind_class("TaskPanelWheel", "<MouseWheel>", _on_mousewheel)
         
         # Set a fixed height for the canvas to ensure scrolling works
         canvas.configure(height=400)
@@ -243,37 +318,19 @@ class AutomationApp:
         button_frame.bind("<Configure>", configure_canvas)
         canvas.bind("<Configure>", lambda e: canvas.itemconfig(canvas_window, width=e.width))
         
-        # System Tasks
-        system_frame = ttk.LabelFrame(button_frame, text="System Tasks", padding="5")
-        system_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Button(system_frame, text="Open URL", command=lambda: self.add_open_url_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Open Application", command=lambda: self.add_open_app_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Open File", command=lambda: self.add_open_file_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Delete File", command=lambda: self.add_delete_file_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Delete Folder & Contents", command=lambda: self.add_delete_folder_contents_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Empty Folder", command=lambda: self.add_empty_folder_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Delete If Empty", command=lambda: self.add_delete_if_empty_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Close Application", command=lambda: self.add_close_app_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(system_frame, text="Run Command", command=lambda: self.add_run_command_task()).pack(fill=tk.X, pady=2)
-        
-        # System Control Tasks
-        control_frame = ttk.LabelFrame(button_frame, text="System Control", padding="5")
-        control_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Button(control_frame, text="Shutdown PC", command=lambda: self.add_shutdown_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(control_frame, text="Restart PC", command=lambda: self.add_restart_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(control_frame, text="Sleep PC", command=lambda: self.add_sleep_task()).pack(fill=tk.X, pady=2)
-        
-        # Utility Tasks
-        utility_frame = ttk.LabelFrame(button_frame, text="Utilities", padding="5")
-        utility_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Button(utility_frame, text="Add Delay", command=lambda: self.add_delay_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(utility_frame, text="Take Screenshot", command=lambda: self.add_screenshot_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(utility_frame, text="Clean Temp Folder", command=lambda: self.add_clean_temp_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(utility_frame, text="Run Security Scan", command=lambda: self.add_security_scan_task()).pack(fill=tk.X, pady=2)
-        ttk.Button(utility_frame, text="Backup Folder", command=lambda: self.add_backup_folder_task()).pack(fill=tk.X, pady=2)
+        # One labelled group of buttons per entry in TASK_BUTTONS
+        for group_label, buttons in self.TASK_BUTTONS:
+            group_frame = ttk.LabelFrame(button_frame, text=group_label, padding="5")
+            group_frame.pack(fill=tk.X, pady=5)
+            
+            for label, task_type in buttons:
+                ttk.Button(group_frame, text=label, command=partial(self._add_task, task_type)).pack(fill=tk.X, pady=2)
+        
+        # Let the mouse wheel scroll the panel when the pointer is over the canvas or any button
+        wheel_widgets = [canvas]
+        for widget in wheel_widgets:
+            widget.bindtags(("TaskPanelWheel",) + widget.bindtags())
+            wheel_widgets.extend(widget.winfo_children())
         
         # No Action Buttons here since they're already in the File menu
         
@@ -289,8 +346,9 @@ class AutomationApp:
             # Identify the item that was clicked on
             item_id = self.task_tree.identify_row(event.y)
             if item_id:
-                # Select the clicked item
-                self.task_tree.selection_set(item_id)
+                # Select the clicked item, keeping a multi-row selection it belongs to
+                if item_id not in self.task_tree.selection():
+                    self.task_tree.selection_set(item_id)
                 # Show the context menu
                 self.task_context_menu.tk_popup(event.x_root, event.y_root)
         finally:
@@ -305,11 +363,10 @@ class AutomationApp:
         self.task_manager.clear_tasks()
         self.refresh_task_list()
         self.current_file_path = None
+        self._saved_bat_path = None
         
-        # Reset timestamps when creating a new list
-        import time
-        self.last_save_time = None
-        self.last_modification_time = time.time()
+        # A new list starts with nothing to save
+        self._dirty = False
         
         self.status_var.set("New task list created")
     
@@ -317,7 +374,7 @@ class AutomationApp:
         """Open an existing task list from a .txt file"""
         file_path = filedialog.askopenfilename(
             title="Open Task List",
-            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+            filetypes=[("Text Files", "*.txt"), ("JSON Files", "*.json"), ("All Files", "*.*")]
         )
         
         if not file_path:
@@ -328,13 +385,12 @@ class AutomationApp:
             self.task_manager.set_tasks(tasks)
             self.refresh_task_list()
             self.current_file_path = file_path
+            self._saved_bat_path = None
             
-            # Initialize the save time to current time (since we just loaded the file)
-            import time
-            self.last_save_time = time.time()
-            self.last_modification_time = self.last_save_time
+            # The loaded tasks match the file, so there is nothing to save yet
+            self._dirty = False
             
-            self.status_var.set(f"Loaded tasks from {os.path.basename(file_path)}")
+            self.status_var.set(f"Loaded tasks from {basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Error Opening File", f"Could not open task list: {str(e)}")
     
@@ -344,18 +400,7 @@ class AutomationApp:
             self.save_task_list_as()
             return
             
-        try:
-            tasks = self.task_manager.get_tasks()
-            self.file_handler.save_tasks(tasks, self.current_file_path)
-            bat_file = self.file_handler.convert_to_bat(tasks, self.current_file_path)
-            
-            # Update the last save time to current time
-            import time
-            self.last_save_time = time.time()
-            
-            self.status_var.set(f"Tasks saved to {os.path.basename(self.current_file_path)} and {os.path.basename(bat_file)}")
-        except Exception as e:
-            messagebox.showerror("Error Saving File", f"Could not save task list: {str(e)}")
+        self._save_to(self.current_file_path)
     
     def save_task_list_as(self):
         """
@@ -371,27 +416,38 @@ class AutomationApp:
         file_path = filedialog.asksaveasfilename(
             title="Save Task List",
             defaultextension=".txt",
-            filetypes=[("Text Files", "*.txt"), ("All Files", "*.*")]
+            filetypes=[("Text Files", "*.txt"), ("JSON Files", "*.json"), ("All Files", "*.*")]
         )
         
         if not file_path:
             return False  # User cancelled
             
-        try:
-            tasks = self.task_manager.get_tasks()
-            self.file_handler.save_tasks(tasks, file_path)
-            bat_file = self.file_handler.convert_to_bat(tasks, file_path)
-            self.current_file_path = file_path
-            
-            # Update the last save time to current time
-            import time
-            self.last_save_time = time.time()
+        return self._save_to(file_path)
+    
+    def _save_to(self, file_path):
+        """
+        Save the tasks and their BAT file, and make the file the current task list
+        
+        Args:
+            file_path (str): Path to save the task list to
             
-            self.status_var.set(f"Tasks saved to {os.path.basename(file_path)} and {os.path.basename(bat_file)}")
-            return True
+        Returns:
+            bool: True if the save was successful, False otherwise
+        """
+        try:
+            bat_file = self.file_handler.save_all(self.task_manager.get_tasks_view(), file_path)
         except Exception as e:
             messagebox.showerror("Error Saving File", f"Could not save task list: {str(e)}")
             return False
+            
+        self.current_file_path = file_path
+        self._saved_bat_path = bat_file
+        
+        # The saved file now matches the tasks
+        self._dirty = False
+        
+        self.status_var.set(f"Tasks saved to {basename(file_path)} and {basename(bat_file)}")
+        return True
     
     def run_tasks(self):
         """Run the current task list"""
@@ -399,21 +455,13 @@ class AutomationApp:
             messagebox.showinfo("No Tasks", "No tasks to run. Add some tasks first.")
             return
             
-        # Always save the tasks first, whether or not they've been saved before
-        if self.current_file_path:
+        # Save the tasks first unless the BAT file from the last save is still current
+        if self._saved_bat_path and not self._have_unsaved_changes():
+            # Nothing changed since the last save, so skip the disk writes
+            pass
+        elif self.current_file_path:
             # Save to existing file
-            try:
-                tasks = self.task_manager.get_tasks()
-                self.file_handler.save_tasks(tasks, self.current_file_path)
-                bat_file = self.file_handler.convert_to_bat(tasks, self.current_file_path)
-                
-                # Update the save timestamp
-                import time
-                self.last_save_time = time.time()
-                
-                self.status_var.set(f"Tasks saved to {os.path.basename(self.current_file_path)} and {os.path.basename(bat_file)}")
-            except Exception as e:
-                messagebox.showerror("Error Saving File", f"Could not save task list: {str(e)}")
+            if not self._save_to(self.current_file_path):
                 return
         else:
             # Need to save to a new file
@@ -422,55 +470,13 @@ class AutomationApp:
             if not self.current_file_path:
                 return
                 
-        # Execute the BAT file
-        bat_path = self.file_handler.get_bat_path(self.current_file_path)
+        # Execute the BAT file written by the save above
+        bat_path = self._saved_bat_path
         try:
             self.task_executor.run_bat_file(bat_path)
-            self.status_var.set(f"Running tasks from {os.path.basename(bat_path)}")
+            self.status_var.set(f"Running tasks from {basename(bat_path)}")
         except Exception as e:
             messagebox.showerror("Error Running Tasks", f"Could not run tasks: {str(e)}")
-        
-        def save_changes():
-            """Save changes to the text file and update the BAT file"""
-            try:
-                # Get the content from the editor
-                content = text_editor.get(1.0, tk.END)
-                
-                # Save to the text file - ensure file path is not None
-                if self.current_file_path:
-                    with open(self.current_file_path, 'w') as f:
-                        f.write(content)
-                    
-                    # Parse the content back into tasks
-                    tasks = self.file_handler.parse_text_to_tasks(content)
-                    
-                    # Update the task manager
-                    self.task_manager.set_tasks(tasks)
-                    
-                    # Create a new BAT file
-                    bat_file = self.file_handler.convert_to_bat(tasks, self.current_file_path)
-                    bat_name = os.path.basename(bat_file) if bat_file else "Unknown"
-                    
-                    # Update the save timestamp
-                    import time
-                    self.last_save_time = time.time()
-                    
-                    # Update the main UI
-                    self.refresh_task_list()
-                    
-                    status_var.set(f"Saved changes to {file_name} and {bat_name}")
-                    self.status_var.set(f"Updated tasks from edited file")
-                    
-                    # Close the window after a short delay
-                    edit_window.after(1500, edit_window.destroy)
-                else:
-                    # Should never get here due to initial check
-                    raise ValueError("No file path available for saving")
-            except Exception as e:
-                messagebox.showerror("Error Saving Changes", f"Could not save changes: {str(e)}")
-        
-        ttk.Button(button_frame, text="Save Changes", command=save_changes).pack(side=tk.RIGHT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=edit_window.destroy).pack(side=tk.RIGHT, padx=5)
     
     def create_column_separators(self):
         """Apply styling to make the Treeview grid lines visible"""
@@ -480,380 +486,236 @@ class AutomationApp:
             if isinstance(tree_container, tk.Frame):
                 tree_container.config(bd=2, relief=tk.GROOVE, bg='#e0e0e0')
                 
-            # Apply enhanced styling to our tree with explicit grid lines
-            style = ttk.Style()
-            
-            # Configure main Treeview appearance with borders
-            style.configure("Treeview", 
-                           background="white",
-                           foreground="black", 
-                           rowheight=25,
-                           fieldbackground="white",
-                           borderwidth=1,
-                           relief="solid")
-            
-            # Add a clear style for row highlights with borders
-            style.map('Treeview', 
-                     background=[('selected', '#e5f1fb')],
-                     foreground=[('selected', 'black')])
-            
-            # Configure headings with distinct appearance and borders
-            style.configure("Treeview.Heading", 
-                           background="#e0e0e0",
-                           foreground="black",
-                           relief="raised", 
-                           borderwidth=1,
-                           font=('Arial', 9, 'bold'))
-            
-            # Apply the main Treeview style that includes borders
-            self.task_tree.configure(style="Treeview")
-            
-            # Only show the headings, hide the tree column
-            self.task_tree.config(show="headings")
-            
-            # Apply alternate row colors for better readability
-            self.task_tree.tag_configure("evenrow", background="#f0f0f0")
-            self.task_tree.tag_configure("oddrow", background="white")
-            
-            #("Applied enhanced Treeview styling with grid lines")
+            # The Treeview and row styles are set once in _configure_styles and
+            # _create_main_interface, so only the surrounding frames change here
             
             # Add dark border around the container for emphasis
             # This creates a box effect that helps the table stand out
             if hasattr(tree_container, 'master') and isinstance(tree_container.master, tk.Frame):
                 tree_container.master.config(padx=2, pady=2, bg='#c0c0c0')
             
-    def _update_separators(self, event=None):
-        """Update the column separators when the Treeview is resized"""
-        # This is called when the Treeview widget changes size
-        # We need to redraw our separator lines
-        if hasattr(self, 'task_tree'):
-            # Schedule the redraw after a short delay to ensure the Treeview
-            # has fully updated its layout
-            self.task_tree.after(100, self.create_column_separators)
-
     def refresh_task_list(self):
-        """Refresh the task list display"""
-        # Clear the current items
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
-            
-        # Add the tasks from the task manager
-        for i, task in enumerate(self.task_manager.get_tasks(), 1):
-            task_type = task.get("type", "")
-            task_details = task.get("details", "")
-            
-            # Determine row tag based on even/odd index for alternating colors
-            row_tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            
-            # Insert task into treeview
-            self.task_tree.insert("", tk.END, values=(
-                i,  # Task number 
-                task_type, 
-                task_details
-            ), tags=(row_tag,))
-        
-        # The style settings in main.py ensure the grid lines are visible
-            
+        """Refresh the whole task list display"""
+        self._pending_rows = None
+        self._update_task_rows(0)
+        
+    def _update_task_rows(self, start, stop=None):
+        """
+        Bring the task list display in line with the task manager, rewriting
+        only the rows that may have changed and reusing the rest
+        
+        Args:
+            start (int): Index of the first row that may have changed
+            stop (int, optional): Index after the last row that may have changed,
+                or None to update up to the end of the list
+        """
+        task_count = self.task_manager.get_task_count()
+        rows = self.task_tree.get_children()
+        
+        # Remove rows left over from tasks that no longer exist, in a single Tk call
+        if len(rows) > task_count:
+            self.task_tree.delete(*rows[task_count:])
+            
+        # Rows for new tasks are appended at the end
+        start = min(start, len(rows))
+        stop = task_count if stop is None else min(stop, task_count)
+        
+        # Update existing rows in place and only insert rows for new tasks.
+        # Rows are written with direct Tcl calls to skip the option formatting
+        # that Treeview.item/insert do per call; Tk repaints once at idle time
+        tree_call = self.task_tree.tk.call
+        tree = str(self.task_tree)
+        for i, task in enumerate(islice(self.task_manager.iter_tasks(), start, stop), start):
+            values = (
+                i + 1,  # Task number 
+                task.type, 
+                task.details
+            )
+            
+            # Alternate row colors based on even/odd task number
+            row_tags = ODD_ROW_TAGS if i % 2 == 0 else EVEN_ROW_TAGS
+            
+            if i < len(rows):
+                tree_call(tree, "item", rows[i], "-values", values, "-tags", row_tags)
+            else:
+                tree_call(tree, "insert", "", tk.END, "-values", values, "-tags", row_tags)
+                
+    def _schedule_refresh(self, start, stop=None):
+        """
+        Mark task list rows as changed and redraw them once Tk is idle, so that
+        several changes in a row cost a single update of the display
+        
+        Args:
+            start (int): Index of the first row that may have changed
+            stop (int, optional): Index after the last row that may have changed,
+                or None for up to the end of the list
+        """
+        if self._pending_rows is None:
+            self.master.after_idle(self._flush_refresh)
+        else:
+            # Merge with the rows already waiting to be redrawn
+            pending_start, pending_stop = self._pending_rows
+            start = min(start, pending_start)
+            stop = None if stop is None or pending_stop is None else max(stop, pending_stop)
+        self._pending_rows = (start, stop)
+        
+    def _flush_refresh(self):
+        """Redraw any task list rows waiting from _schedule_refresh"""
+        if self._pending_rows is not None:
+            start, stop = self._pending_rows
+            self._pending_rows = None
+            self._update_task_rows(start, stop)
+            
+    def _show_new_task(self):
+        """Add a row for the task just appended to the task manager"""
+        self._schedule_refresh(len(self.task_tree.get_children()))
+        
     # Using Treeview selection instead of canvas click handler
     
+    def _get_selected_index(self, title, prompt):
+        """
+        Get the index of the selected task, or ask for a task number if none is selected
+        
+        Args:
+            title (str): Title of the dialog shown when nothing is selected
+            prompt (str): Prompt of the dialog shown when nothing is selected
+            
+        Returns:
+            int: 0-based index of the task, or None if the user cancelled
+        """
+        # Rows are kept in task order, so the row position is the task index
+        selected_items = self.task_tree.selection()
+        if selected_items:
+            return self.task_tree.index(selected_items[0])
+            
+        # No selection, ask user for task number
+        task_num = simpledialog.askinteger(title, prompt,
+                                           minvalue=1,
+                                           maxvalue=self.task_manager.get_task_count())
+        if task_num is None:
+            return None  # User cancelled
+        # Convert to 0-based index
+        return task_num - 1
+    
     def delete_task(self, task_idx=None):
         """Delete a task by index or use the currently selected one"""
+        # Make sure the rows on screen match the tasks before reading the selection
+        self._flush_refresh()
+        
         if task_idx is None:
             # If no specific task, use the selected item in the treeview
             if not self.task_manager.has_tasks():
                 messagebox.showinfo("No Tasks", "No tasks to delete.")
                 return
                 
-            # Check if an item is selected in the treeview
+            # Delete every selected task in a single pass over the list
             selected_items = self.task_tree.selection()
-            if selected_items:
-                # Get the task id from the selected item
-                item = selected_items[0]  # Get the first selected item
-                values = self.task_tree.item(item, 'values')
-                if values and len(values) > 0:
-                    task_num = int(values[0])  # The task number is the first column
-                    # Convert to 0-based index
-                    task_idx = task_num - 1
-                else:
-                    # If no values, ask user for task number
-                    task_num = simpledialog.askinteger("Delete Task", 
-                                                    "Enter the task number to delete:",
-                                                    minvalue=1, 
-                                                    maxvalue=len(self.task_manager.get_tasks()))
-                    if task_num is None:
-                        return  # User cancelled
-                    # Convert to 0-based index
-                    task_idx = task_num - 1
-            else:
-                # No selection, ask user for task number
-                task_num = simpledialog.askinteger("Delete Task", 
-                                                "Enter the task number to delete:",
-                                                minvalue=1, 
-                                                maxvalue=len(self.task_manager.get_tasks()))
-                if task_num is None:
-                    return  # User cancelled
-                # Convert to 0-based index
-                task_idx = task_num - 1
+            if len(selected_items) > 1:
+                indices = [self.task_tree.index(item) for item in selected_items]
+                count = self.task_manager.delete_tasks(indices)
+                self._mark_modified()
+                
+                # Only the rows from the first deleted task onwards change
+                self._schedule_refresh(min(indices))
+                self.status_var.set(f"{count} tasks deleted")
+                return
+                
+            task_idx = self._get_selected_index("Delete Task", "Enter the task number to delete:")
+            if task_idx is None:
+                return
             
         # Delete from the task manager
         result = self.task_manager.delete_task(task_idx)
         if result:
-            # Update modification time
-            self._update_modification_time()
+            self._mark_modified()
             
-            # Refresh the display
-            self.refresh_task_list()
+            # Only the rows from the deleted task onwards change
+            self._schedule_refresh(task_idx)
             self.status_var.set("Task deleted")
         else:
             messagebox.showerror("Error", "Could not delete task.")
     
     def move_task(self, direction, task_idx=None):
         """Move a task up or down in the list"""
+        # Make sure the rows on screen match the tasks before reading the selection
+        self._flush_refresh()
+        
         if task_idx is None:
             # If no specific task, use the selected item in the treeview
             if not self.task_manager.has_tasks():
                 messagebox.showinfo("No Tasks", "No tasks to move.")
                 return
                 
-            # Check if an item is selected in the treeview
-            selected_items = self.task_tree.selection()
-            if selected_items:
-                # Get the task id from the selected item
-                item = selected_items[0]  # Get the first selected item
-                values = self.task_tree.item(item, 'values')
-                if values and len(values) > 0:
-                    task_num = int(values[0])  # The task number is the first column
-                    # Convert to 0-based index
-                    task_idx = task_num - 1
-                else:
-                    # If no values, ask user for task number
-                    task_num = simpledialog.askinteger(f"Move Task {direction.capitalize()}", 
-                                                    f"Enter the task number to move {direction}:",
-                                                    minvalue=1, 
-                                                    maxvalue=len(self.task_manager.get_tasks()))
-                    if task_num is None:
-                        return  # User cancelled
-                    # Convert to 0-based index
-                    task_idx = task_num - 1
-            else:
-                # No selection, ask user for task number
-                task_num = simpledialog.askinteger(f"Move Task {direction.capitalize()}", 
-                                                f"Enter the task number to move {direction}:",
-                                                minvalue=1, 
-                                                maxvalue=len(self.task_manager.get_tasks()))
-                if task_num is None:
-                    return  # User cancelled
-                # Convert to 0-based index
-                task_idx = task_num - 1
+            task_idx = self._get_selected_index(f"Move Task {direction.capitalize()}",
+                                                f"Enter the task number to move {direction}:")
+            if task_idx is None:
+                return
             
         # Move the task
         if direction == "up":
             success = self.task_manager.move_task_up(task_idx)
+            new_idx = task_idx - 1
         else:  # down
             success = self.task_manager.move_task_down(task_idx)
+            new_idx = task_idx + 1
             
         if success:
-            # Update modification time
-            self._update_modification_time()
+            self._mark_modified()
             
-            self.refresh_task_list()
+            # Only the two swapped rows change; keep the moved task selected
+            first = min(task_idx, new_idx)
+            self._schedule_refresh(first, first + 2)
+            self.task_tree.selection_set(self.task_tree.get_children()[new_idx])
             self.status_var.set(f"Task moved {direction}")
         else:
             messagebox.showinfo("Cannot Move", f"Cannot move task {direction} further.")
     
-    def add_open_url_task(self):
-        """Add a task to open a URL"""
-        url = simpledialog.askstring("Open URL", "Enter the URL to open:")
-        if url:
-            if not (url.startswith("http://") or url.startswith("https://")):
-                url = "https://" + url
-            self.task_manager.add_task("open_url", url)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Open URL {url}")
-    
-    def _update_modification_time(self):
-        """Update the modification timestamp to mark changes"""
-        import time
-        self.last_modification_time = time.time()
-    
-    def add_open_app_task(self):
-        """Add a task to open an application"""
-        app_path = filedialog.askopenfilename(
-            title="Select Application",
-            filetypes=[("Executable Files", "*.exe"), ("All Files", "*.*")]
-        )
-        
-        if app_path:
-            self.task_manager.add_task("open_app", app_path)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Open Application {os.path.basename(app_path)}")
+    def _mark_modified(self):
+        """Mark the tasks as changed since the last save"""
+        self._dirty = True
     
-    def add_open_file_task(self):
-        """Add a task to open a file with its default application"""
-        file_path = filedialog.askopenfilename(
-            title="Select File to Open"
-        )
+    def _add_task(self, task_type):
+        """
+        Ask for the details of a new task and add it to the end of the task list
         
-        if file_path:
-            self.task_manager.add_task("open_file", file_path)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Open File {os.path.basename(file_path)}")
-    
-    def add_close_app_task(self):
-        """Add a task to close an application"""
-        app_name = simpledialog.askstring("Close Application", 
-                                          "Enter the application name to close (e.g., notepad.exe):")
-        if app_name:
-            self.task_manager.add_task("close_app", app_name)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Close Application {app_name}")
-    
-    def add_run_command_task(self):
-        """Add a task to run a command in CMD"""
-        command = simpledialog.askstring("Run Command", 
-                                         "Enter the command to run in command prompt:")
-        if command:
-            self.task_manager.add_task("run_command", command)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Run Command {command}")
-    
-    def add_shutdown_task(self):
-        """Add a task to shutdown the computer"""
-        delay = simpledialog.askinteger("Shutdown Delay", 
-                                        "Enter delay in seconds before shutdown (0 for immediate):",
-                                        initialvalue=0, minvalue=0)
-        if delay is not None:  # Check for Cancel
-            self.task_manager.add_task("shutdown", str(delay))
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Shutdown PC with {delay}s delay")
-    
-    def add_restart_task(self):
-        """Add a task to restart the computer"""
-        delay = simpledialog.askinteger("Restart Delay", 
-                                        "Enter delay in seconds before restart (0 for immediate):",
-                                        initialvalue=0, minvalue=0)
-        if delay is not None:  # Check for Cancel
-            self.task_manager.add_task("restart", str(delay))
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Restart PC with {delay}s delay")
-    
-    def add_sleep_task(self):
-        """Add a task to put the computer to sleep"""
-        self.task_manager.add_task("sleep", "")
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set("Added task: Sleep PC")
-    
-    def add_delay_task(self):
-        """Add a task to wait for a specified time"""
-        seconds = simpledialog.askinteger("Add Delay", 
-                                         "Enter delay in seconds:",
-                                         initialvalue=5, minvalue=1)
-        if seconds is not None:  # Check for Cancel
-            self.task_manager.add_task("delay", str(seconds))
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Delay for {seconds} seconds")
-    
-    def add_screenshot_task(self):
-        """Add a task to take a screenshot"""
-        folder = filedialog.askdirectory(title="Select folder to save screenshots")
-        if folder:
-            self.task_manager.add_task("screenshot", folder)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Take screenshot to {folder}")
-    
-    def add_clean_temp_task(self):
-        """Add a task to clean the temp folder"""
-        self.task_manager.add_task("clean_temp", "")
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set("Added task: Clean temporary files")
-    
-    def add_delete_file_task(self):
-        """Add a task to delete a file"""
-        file_path = filedialog.askopenfilename(
-            title="Select File to Delete",
-            filetypes=[("All Files", "*.*")]
-        )
+        Args:
+            task_type (str): Type of the task to add, a key of TASK_SPECS
+        """
+        dialog, dialog_args, dialog_options, convert, additional, status = self.TASK_SPECS[task_type]
         
-        if not file_path:
-            return  # User cancelled
+        if dialog is None:
+            details = ""
+        else:
+            if dialog == "backup":
+                value = self._ask_backup_folders()
+            else:
+                value = _TASK_DIALOGS[dialog](*dialog_args, **dialog_options)
             
-        self.task_manager.add_task("delete_file", file_path)
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set(f"Added task: Delete file {os.path.basename(file_path)}")
-        
-    def add_delete_folder_contents_task(self):
-        """Add a task to delete a folder and all its contents"""
-        folder_path = filedialog.askdirectory(
-            title="Select Folder to Delete with Contents"
-        )
-        
-        if not folder_path:
-            return  # User cancelled
-        
-        folder_name = os.path.basename(folder_path)    
-        # Add the task with "with contents" option
-        self.task_manager.add_task("delete_folder", folder_path, "with contents")
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set(f"Added task: Delete folder {folder_name} and all its contents")
-    
-    def add_empty_folder_task(self):
-        """Add a task to empty a folder but keep the folder itself"""
-        folder_path = filedialog.askdirectory(
-            title="Select Folder to Empty"
-        )
-        
-        if not folder_path:
-            return  # User cancelled
-        
-        folder_name = os.path.basename(folder_path)    
-        # Add the task with "contents only" option
-        self.task_manager.add_task("empty_folder", folder_path, "")
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set(f"Added task: Empty folder {folder_name} (keep folder)")
+            # Dialogs return None, an empty string or an empty tuple when cancelled
+            if value is None or value == "" or value == ():
+                return
+                
+            if dialog == "backup":
+                details, additional = value
+            else:
+                details = convert(value)
+        
+        self.task_manager.add_task(task_type, details, additional)
+        self._mark_modified()
+        self._show_new_task()
+        self.status_var.set("Added task: " + status.format(details=details,
+                                                           name=basename(details),
+                                                           additional=additional))
     
-    def add_delete_if_empty_task(self):
-        """Add a task to delete a folder only if it's empty"""
-        folder_path = filedialog.askdirectory(
-            title="Select Folder to Delete (if empty)"
-        )
+    def _ask_backup_folders(self):
+        """
+        Ask for the source and destination folders of a backup task
         
-        if not folder_path:
-            return  # User cancelled
+        Returns:
+            tuple: (source, destination) folder paths, or None if the user cancelled
+        """
+        folders = None
         
-        folder_name = os.path.basename(folder_path)    
-        # Add the task with "if empty" option
-        self.task_manager.add_task("delete_folder_if_empty", folder_path, "")
-        self._update_modification_time()
-        self.refresh_task_list()
-        self.status_var.set(f"Added task: Delete folder {folder_name} only if empty")
-    
-    def add_security_scan_task(self):
-        """Add a task to run a Windows security scan"""
-        scan_type = simpledialog.askstring("Security Scan", 
-                                           "Enter scan type (quick or full):",
-                                           initialvalue="quick")
-        if scan_type:
-            self.task_manager.add_task("security_scan", scan_type.lower())
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Run {scan_type} security scan")
-            
-    def add_backup_folder_task(self):
-        """Add a task to backup a folder to another location"""
         # Create a dialog for folder selection
         backup_dialog = tk.Toplevel(self.master)
         backup_dialog.title("Backup Folder")
@@ -903,6 +765,7 @@ class AutomationApp:
         button_frame.grid(row=3, column=0, columnspan=3, pady=10)
         
         def add_backup_task():
+            nonlocal folders
             source = source_var.get().strip()
             destination = dest_var.get().strip()
             
@@ -914,17 +777,15 @@ class AutomationApp:
                 messagebox.showwarning("Missing Destination", "Please select a destination folder for the backup.")
                 return
                 
-            # Add the task (using old-style add_task for compatibility)
-            self.task_manager.add_task("backup_folder", source, destination)
-            self._update_modification_time()
-            self.refresh_task_list()
-            self.status_var.set(f"Added task: Backup {source} to {destination}")
+            folders = (source, destination)
             backup_dialog.destroy()
             
         ttk.Button(button_frame, text="Add Backup Task", command=add_backup_task).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=backup_dialog.destroy).pack(side=tk.LEFT, padx=5)
-    
-
+        
+        # Wait for the dialog to close, like the simpledialog prompts do
+        self.master.wait_window(backup_dialog)
+        return folders
     
     def not_implemented_yet(self):
         """Placeholder for features not yet implemented"""
@@ -955,19 +816,4 @@ class AutomationApp:
         
     def _have_unsaved_changes(self):
         """Check if there are unsaved changes since last save"""
-        # If we don't have a file path yet, but we have tasks, then we have unsaved changes
-        if not self.current_file_path and self.task_manager.has_tasks():
-            return True
-            
-        # If we have a file path, we'll implement a simple timestamp-based check
-        if hasattr(self, 'last_save_time') and self.last_save_time is not None:
-            # Get the modification time, defaulting to 0 if it doesn't exist
-            mod_time = getattr(self, 'last_modification_time', 0) 
-            # Check if we've modified tasks since the last save
-            if mod_time is not None and isinstance(mod_time, (int, float)) and isinstance(self.last_save_time, (int, float)):
-                return mod_time > self.last_save_time
-            return False
-        
-        # If we don't have a last_save_time attribute yet, assume no unsaved changes
-        # since the user just opened the application or loaded a file
-        return False
+        return self._dirty
@@ -4,16 +4,80 @@ Handles execution of automation tasks and .bat files
 """
 
 import os
+import shutil
+import stat
 import subprocess
 import sys
 import webbrowser
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Default number of threads copying files in a folder backup. Copies are I/O-bound,
+# so more threads than cores helps most on network drives
+BACKUP_COPY_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Threads deleting subfolders when cleaning the temp folder or deleting a folder
+# with its contents, used only when there are more than DELETE_PARALLEL_MIN
+# entries so small folders skip the pool overhead
+DELETE_WORKERS = 8
+DELETE_PARALLEL_MIN = 4
+
+# Reparse tag of a directory junction, which the stat module only defines on Windows
+_IO_REPARSE_TAG_MOUNT_POINT = getattr(stat, "IO_REPARSE_TAG_MOUNT_POINT", 0xA0000003)
+
+def _is_junction(entry):
+    """
+    Check whether an os.scandir entry is a directory junction. Junctions report
+    as directories, so deleting through them would empty the folder they point to.
+    On Windows scandir caches the entry's lstat result, so this costs no extra stat call
+    
+    Args:
+        entry (os.DirEntry): The entry to check
+        
+    Returns:
+        bool: True if the entry is a directory junction
+    """
+    return (os.name == "nt" and
+            getattr(entry.stat(follow_symlinks=False), "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT)
 
 class TaskExecutor:
     """Executes automation tasks"""
     
+    # Map scan types to Windows Defender commands
+    _SCAN_COMMANDS = MappingProxyType({
+        "quick": "Start-MpScan -ScanType QuickScan",
+        "full": "Start-MpScan -ScanType FullScan",
+        "custom": "Start-MpScan -ScanType CustomScan"
+    })
+    
     def __init__(self):
         """Initialize the task executor"""
-        pass
+        # The temp folder does not change while the application runs, so look it up once
+        self._temp_folder = os.environ.get('TEMP')
+        
+        # Paths seen to exist by _path_exists, so repeated checks skip the stat call
+        self._existing_paths = set()
+    
+    def _path_exists(self, path):
+        """
+        Check whether a path exists, remembering paths that do
+        
+        Only existing paths are remembered, so a file created later is still found.
+        Every task that deletes or copies files forgets all remembered paths
+        when it finishes, since it may have removed any of them or their folders.
+        
+        Args:
+            path (str): Path to check
+            
+        Returns:
+            bool: True if the path exists
+        """
+        if path in self._existing_paths:
+            return True
+        if os.path.exists(path):
+            self._existing_paths.add(path)
+            return True
+        return False
     
     def run_bat_file(self, bat_file_path):
         """
@@ -28,6 +92,7 @@ class TaskExecutor:
         Raises:
             Exception: If the file cannot be executed
         """
+        # Not cached: a missing BAT file would not make the launch itself fail
         if not os.path.exists(bat_file_path):
             raise FileNotFoundError(f"BAT file not found: {bat_file_path}")
         
@@ -36,8 +101,8 @@ class TaskExecutor:
             subprocess.Popen(
                 [bat_file_path],
                 shell=True,  # Required for .bat files
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NEW_CONSOLE  # Open in new command window
             )
             return True
@@ -49,7 +114,7 @@ class TaskExecutor:
         Execute a single task directly (for testing or immediate execution)
         
         Args:
-            task (dict): A task dictionary with type, details, and additional info
+            task (Task): A task with type, details, and additional info
             
         Returns:
             bool: True if successful, False otherwise
@@ -60,9 +125,9 @@ class TaskExecutor:
         # Debug output
         #(f"TASK EXECUTOR: Executing task: {task}")
         
-        task_type = task.get("type", "")
-        details = task.get("details", "")
-        additional = task.get("additional", "")
+        task_type = task.type
+        details = task.details
+        additional = task.additional
         
         #(f"TASK TYPE: {task_type}")
         #(f"DETAILS: {details}")
@@ -111,8 +176,8 @@ class TaskExecutor:
         try:
             subprocess.run(["taskkill", "/f", "/im", app_name], 
                            check=False, 
-                           stdout=subprocess.PIPE, 
-                           stderr=subprocess.PIPE)
+                           stdout=subprocess.DEVNULL, 
+                           stderr=subprocess.DEVNULL)
             return True
         except Exception as e:
             raise Exception(f"Error closing application: {str(e)}")
@@ -168,9 +233,10 @@ class TaskExecutor:
             timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
             filename = os.path.join(save_folder, f"screenshot_{timestamp}.png")
             
-            # Take screenshot and save
+            # Take screenshot and save it with fast, light PNG compression,
+            # since most of the save time is otherwise spent in zlib
             screenshot = ImageGrab.grab()
-            screenshot.save(filename)
+            screenshot.save(filename, format='PNG', compress_level=1, optimize=False)
             return True
         except Exception as e:
             raise Exception(f"Error taking screenshot: {str(e)}")
@@ -179,28 +245,79 @@ class TaskExecutor:
         """Clean the Windows temp folder"""
         try:
             # Get the temp folder path
-            temp_folder = os.environ.get('TEMP')
+            temp_folder = self._temp_folder
             if not temp_folder:
                 raise Exception("Could not determine TEMP folder location")
                 
-            # Run the command to clean temp files
-            subprocess.run(f'del /q /f /s "{temp_folder}\\*"', shell=True, check=False)
+            # Delete the temp files in-process instead of through "del" in a shell
+            with os.scandir(temp_folder) as entries:
+                entries = list(entries)
+            subfolders = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+            
+            if len(subfolders) <= DELETE_PARALLEL_MIN:
+                for entry in entries:
+                    self._wipe_entry(entry)
+                return True
+                
+            # Sweep the subfolders on a thread pool while deleting the loose files here.
+            # _wipe_entry skips anything it cannot delete, so one locked file
+            # does not stop the rest of the sweep
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                futures = [executor.submit(self._wipe_entry, entry) for entry in subfolders]
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        self._wipe_entry(entry)
+                for future in as_completed(futures):
+                    future.result()
             return True
         except Exception as e:
             raise Exception(f"Error cleaning temp folder: {str(e)}")
+        finally:
+            # Paths under the files touched here may be gone now
+            self._existing_paths.clear()
+    
+    def _wipe_folder_contents(self, folder_path):
+        """
+        Delete everything inside a folder but keep the folder itself, skipping
+        files and folders that cannot be deleted (for example because they are in use)
+        
+        Args:
+            folder_path (str): Path to the folder to empty
+        """
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                self._wipe_entry(entry)
+    
+    def _wipe_entry(self, entry):
+        """
+        Delete a file or folder found by os.scandir, ignoring entries that cannot be deleted
+        
+        Args:
+            entry (os.DirEntry): The file or folder to delete
+        """
+        try:
+            # DirEntry caches the entry type, so this costs no extra stat call
+            if entry.is_dir(follow_symlinks=False):
+                # Remove directory junctions without following them out of the folder
+                if not _is_junction(entry):
+                    self._wipe_folder_contents(entry.path)
+                os.rmdir(entry.path)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except PermissionError:
+                    # Clear the read-only flag, like "del /f", and try again
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.unlink(entry.path)
+        except OSError:
+            # In use, access denied or already gone
+            pass
     
     def _run_security_scan(self, scan_type="quick"):
         """Run a Windows Defender scan"""
         try:
-            # Map scan types to Windows Defender commands
-            scan_commands = {
-                "quick": "Start-MpScan -ScanType QuickScan",
-                "full": "Start-MpScan -ScanType FullScan",
-                "custom": "Start-MpScan -ScanType CustomScan"
-            }
-            
             # Get the appropriate command
-            command = scan_commands.get(scan_type.lower(), scan_commands["quick"])
+            command = self._SCAN_COMMANDS.get(scan_type.lower(), self._SCAN_COMMANDS["quick"])
             
             # Run the PowerShell command
             subprocess.run(["powershell", "-Command", command], check=True)
@@ -211,21 +328,26 @@ class TaskExecutor:
     def _delete_file(self, file_path):
         """Delete a file"""
         try:
-            if os.path.exists(file_path):
+            if self._path_exists(file_path):
                 os.remove(file_path)
                 return True
             else:
                 raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise Exception(f"Error deleting file: {str(e)}")
+        finally:
+            # Paths under the files touched here may be gone now
+            self._existing_paths.clear()
     
-    def _backup_folder(self, source_folder, destination_folder):
+    def _backup_folder(self, source_folder, destination_folder, max_workers=None):
         """
         Backup files from one folder to another
         
         Args:
             source_folder (str): Path to the folder to backup
             destination_folder (str): Path where to save the backup
+            max_workers (int, optional): Number of threads copying files,
+                defaults to BACKUP_COPY_WORKERS
             
         Returns:
             bool: True if successful
@@ -234,11 +356,8 @@ class TaskExecutor:
             Exception: If the backup cannot be completed
         """
         try:
-            import os
-            import shutil
-            
             # Make sure the source folder exists
-            if not os.path.exists(source_folder):
+            if not self._path_exists(source_folder):
                 raise FileNotFoundError(f"Source folder not found: {source_folder}")
                 
             # Create destination folder if it doesn't exist
@@ -249,34 +368,47 @@ class TaskExecutor:
             source_name = os.path.basename(source_folder)
             dest_path = os.path.join(destination_folder, source_name)
             
-            # If the destination doesn't exist, create it
-            if not os.path.exists(dest_path):
-                os.makedirs(dest_path)
-            
-            # Walk through source folder and copy all files and subdirectories
-            for root, dirs, files in os.walk(source_folder):
-                # Create relative path to maintain folder structure
-                rel_path = os.path.relpath(root, source_folder)
+            # Let copytree walk the source and create the destination folders, and
+            # hand each file copy to the thread pool. copytree creates a folder
+            # before copying the files in it, so every destination folder exists
+            # by the time its copies run
+            with ThreadPoolExecutor(max_workers=max_workers or BACKUP_COPY_WORKERS) as executor:
+                futures = []
+                
+                def queue_copy(src_file, dest_file):
+                    futures.append(executor.submit(shutil.copy2, src_file, dest_file))  # copy2 preserves metadata
+                    return dest_file
                 
-                # Create subdirectories in destination
-                for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
-                    rel_dir_path = os.path.relpath(dir_path, source_folder)
-                    dest_dir = os.path.join(dest_path, rel_dir_path)
-                    if not os.path.exists(dest_dir):
-                        os.makedirs(dest_dir)
+                shutil.copytree(source_folder, dest_path, copy_function=queue_copy, dirs_exist_ok=True)
                 
-                # Copy files to destination
-                for file_name in files:
-                    src_file = os.path.join(root, file_name)
-                    rel_file_path = os.path.relpath(src_file, source_folder)
-                    dest_file = os.path.join(dest_path, rel_file_path)
-                    shutil.copy2(src_file, dest_file)  # copy2 preserves metadata
+                # Re-raise the first copy error
+                for future in as_completed(futures):
+                    future.result()
             
             return True
             
         except Exception as e:
             raise Exception(f"Error backing up folder: {str(e)}")
+        finally:
+            # Paths under the files touched here may be gone now
+            self._existing_paths.clear()
+    
+    def _remove_entry(self, entry):
+        """
+        Delete a file, or a folder with all its contents, found by os.scandir
+        
+        Args:
+            entry (os.DirEntry): The file or folder to delete
+        """
+        # DirEntry caches the entry type, so this costs no extra stat call
+        if entry.is_dir(follow_symlinks=False):
+            # rmtree refuses directory junctions, so remove the junction itself
+            if _is_junction(entry):
+                os.rmdir(entry.path)
+            else:
+                shutil.rmtree(entry.path)
+        else:
+            os.remove(entry.path)
     
     def _delete_folder(self, folder_path, option="if empty"):
         """
@@ -296,25 +428,39 @@ class TaskExecutor:
             Exception: If the folder cannot be deleted
         """
         try:
-            if not os.path.exists(folder_path):
+            if not self._path_exists(folder_path):
                 raise FileNotFoundError(f"Folder not found: {folder_path}")
                 
             if not os.path.isdir(folder_path):
                 raise ValueError(f"Not a directory: {folder_path}")
                 
-            import shutil
-                
             if option == "with contents":
-                # Delete recursively, similar to rm -rf
-                shutil.rmtree(folder_path)
+                # Delete recursively, similar to rm -rf. Symlinks and directory
+                # junctions go straight to rmtree, which refuses them, so nothing
+                # is ever deleted through the link
+                folder_stat = os.lstat(folder_path)
+                if (stat.S_ISLNK(folder_stat.st_mode) or
+                        getattr(folder_stat, "st_reparse_tag", 0) == _IO_REPARSE_TAG_MOUNT_POINT):
+                    entries = []
+                else:
+                    with os.scandir(folder_path) as entries:
+                        entries = list(entries)
+                    
+                if len(entries) <= DELETE_PARALLEL_MIN:
+                    shutil.rmtree(folder_path)
+                else:
+                    # Delete the top-level entries on a thread pool, then the folder itself
+                    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                        futures = [executor.submit(self._remove_entry, entry) for entry in entries]
+                        # Re-raise the first error
+                        for future in as_completed(futures):
+                            future.result()
+                    os.rmdir(folder_path)
             elif option == "contents only":
                 # Delete all contents but keep the folder itself
-                for item in os.listdir(folder_path):
-                    item_path = os.path.join(folder_path, item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                    else:
-                        os.remove(item_path)
+                with os.scandir(folder_path) as entries:
+                    for entry in entries:
+                        self._remove_entry(entry)
                 #(f"Deleted contents of folder: {folder_path}")
             else:
                 # Delete only if empty
@@ -329,3 +475,6 @@ class TaskExecutor:
             return True
         except Exception as e:
             raise Exception(f"Error deleting folder: {str(e)}")
+        finally:
+            # Paths under the files touched here may be gone now
+            self._existing_paths.clear()
@@ -3,6 +3,17 @@ Task Manager for the AutoSpark Application
 Handles the storage and manipulation of automation tasks
 """
 
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Task:
+    """A single automation task"""
+    type: str
+    details: str
+    additional: str = ""
+
+
 class TaskManager:
     """Manages the collection of automation tasks"""
     
@@ -19,22 +30,30 @@ class TaskManager:
             details (str): The main details of the task
             additional (str, optional): Additional information or parameters
         """
-        self._tasks.append({
-            "type": task_type,
-            "details": details,
-            "additional": additional
-        })
+        self._tasks.append(Task(task_type, details, additional))
     
     def get_tasks(self):
         """Return the list of tasks"""
         return self._tasks.copy()
     
+    def get_tasks_view(self):
+        """Return the tasks as a read-only tuple, for callers that don't modify the list"""
+        return tuple(self._tasks)
+    
+    def iter_tasks(self):
+        """Return an iterator over the tasks without copying the list"""
+        return iter(self._tasks)
+    
+    def get_task_count(self):
+        """Return the number of tasks in the list"""
+        return len(self._tasks)
+    
     def set_tasks(self, tasks):
         """
         Replace the current task list with a new one
         
         Args:
-            tasks (list): List of task dictionaries
+            tasks (list): List of Task objects
         """
         self._tasks = tasks.copy()
     
@@ -53,6 +72,21 @@ class TaskManager:
             return True
         return False
     
+    def delete_tasks(self, indices):
+        """
+        Delete several tasks by index, rebuilding the list once
+        
+        Args:
+            indices (iterable): The indices of the tasks to delete
+            
+        Returns:
+            int: The number of tasks deleted
+        """
+        indices = set(indices)
+        count = len(self._tasks)
+        self._tasks = [task for i, task in enumerate(self._tasks) if i not in indices]
+        return count - len(self._tasks)
+    
     def move_task_up(self, index):
         """
         Move a task up in the list (swap with previous task)
@@ -99,10 +133,11 @@ class TaskManager:
             index (int): The index of the task
             
         Returns:
-            dict: The task dictionary, or None if index is invalid
+            Task: The task, or None if index is invalid
         """
+        # Tasks are immutable, so they can be handed out without copying
         if 0 <= index < len(self._tasks):
-            return self._tasks[index].copy()
+            return self._tasks[index]
         return None
         
 